@@ -10,7 +10,7 @@ Usage examples:
     python demo.py --db ~/passwords.kdbx --entry "My Website" --get-credentials
     python demo.py --db ~/passwords.kdbx --entry "My Website" --get-credentials --gui
     python demo.py --db ~/passwords.kdbx --entry "My Website" --autotype
-    python demo.py --db ~/passwords.kdbx --list-entries --gui
+    python demo.py --db ~/passwords.kdbx --entry "My Website" --get-full-entry --gui
     python demo.py --interactive
     python demo.py --interactive --gui
 
@@ -22,17 +22,136 @@ Created: 2025-08-11
 """
 
 import argparse
-import logging
+import functools
+import importlib.util
+import os
+import pathlib
 import sys
 
-try:
-    from keepassfunctions.keepassfunctions import KeePassFunctions
-except ImportError:
+from collections import namedtuple
+
+# Only check that the module is available, it is imported by _import_kpf() where a database is opened
+if (importlib.util.find_spec("keepassfunctions") is None
+        or importlib.util.find_spec("keepassfunctions.keepassfunctions") is None):
     print("Error: Could not import KeePassFunctions. Make sure the module is in your Python path.")
     sys.exit(1)
 
+# Interactive mode menu, written in one call on every redraw
+_MENU = (
+    "\n" + "="*50 + "\n"
+    "Available actions:\n"
+    "1. Search entries\n"
+    "2. Get credentials\n"
+    "3. Get full entry details\n"
+    "4. Execute autotype sequence\n"
+    "5. Compare GUI vs console\n"
+    "6. Exit\n"
+)
+
+# Banner shown on every run, and quick start help shown when no arguments are given
+_BANNER = "🔐 KeePass Functions Demo Script\n" + "="*40 + "\n"
+_QUICK_HELP = """No arguments provided. Here are some quick examples:
+
+Quick start options:
+  python demo.py --interactive           # Interactive mode with console input
+  python demo.py --interactive --gui     # Interactive mode with GUI input
+  python demo.py --help                  # Show all options
+
+For GUI vs Console comparison:
+  python demo.py --compare
+
+"""
+
+# Entry count per normalized database path, reused by repeated comparison runs in the same session.
+# The database is still opened to test the input method, this only skips walking its entries.
+_entry_count_cache = {}
+
+# Display fields of an entry, kept without the password so cached lookups don't hold it in memory
+_EntryDetails = namedtuple('_EntryDetails', ['title', 'username', 'has_password', 'url', 'notes', 'autotype_sequence'])
+
+def _mask(secret):
+    """Mask a secret for display with a fixed width, so its length is not shown either.
+
+    Args:
+        secret: Value to mask, only its truthiness is used
+
+    Returns:
+        str: Fixed mask, or 'N/A' if there is no value
+    """
+    return '********' if secret else 'N/A'
+
+def _trunc(text, length=100):
+    """Shorten text for display.
+
+    Args:
+        text (str): Text to shorten
+        length (int): Maximum number of characters to show
+
+    Returns:
+        str: Text cut at length with a trailing ellipsis, or 'N/A' if there is no text
+    """
+    if not text:
+        return 'N/A'
+    return text if len(text) <= length else f"{text[:length]}…"
+
+def _import_kpf():
+    """Import KeePassFunctions where a database is opened, exiting cleanly if it or its dependencies are missing.
+
+    Returns:
+        type: The KeePassFunctions class
+    """
+    try:
+        from keepassfunctions.keepassfunctions import KeePassFunctions
+    except ImportError:
+        print("Error: Could not import KeePassFunctions. Make sure the module is in your Python path.")
+        sys.exit(1)
+    return KeePassFunctions
+
+def _normalize_path(path):
+    """Expand and absolutize a database path so equal files compare equal.
+
+    Args:
+        path (str): Path as entered by the user
+
+    Returns:
+        str: Absolute path with ~ expanded
+    """
+    return os.path.abspath(os.path.expanduser(path))
+
+def _db_path_arg(value):
+    """Argparse type for --db, expanding ~ once.
+
+    Args:
+        value (str): Path as given on the command line
+
+    Returns:
+        pathlib.Path: Expanded database path
+
+    Raises:
+        argparse.ArgumentTypeError: If the path is empty
+    """
+    if not value:
+        raise argparse.ArgumentTypeError("database path must not be empty")
+    return pathlib.Path(os.path.expanduser(value))
+
+def _cached_entry_count(handle, path):
+    """Get the entry count of an open database, walking its entries only once per path.
+
+    Args:
+        handle (KeePassFunctions): Open database to read the count from on a cache miss
+        path (str): Path the database was opened from, used as cache key
+
+    Returns:
+        int: Number of entries in the database
+    """
+    key = _normalize_path(path)
+    if key not in _entry_count_cache:
+        _entry_count_cache[key] = handle.get_entry_count()
+    return _entry_count_cache[key]
+
 def setup_logging(verbose=False):
     """Setup logging configuration."""
+    import logging
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         level=level,
@@ -42,23 +161,24 @@ def setup_logging(verbose=False):
         ]
     )
 
-def get_full_entry_demo(db_path, entry_title, with_gui=False):
+def get_full_entry_demo(kp, entry_title):
     """Demo: Get full entry details for a specific entry."""
-    input_method = "GUI" if with_gui else "console"
-    print(f"Getting full entry details for: '{entry_title}' (using {input_method} input)")
+    print(f"Getting full entry details for: '{entry_title}'")
 
     try:
-        with KeePassFunctions(db_path, with_gui=with_gui) as kp:
-            entry = kp.get_credentials(entry_title, return_entry=True)
-            print(f"\n📋 Entry Details:")
-            print(f"   Title: {entry.title}")
-            print(f"   Username: {entry.username or 'N/A'}")
-            print(f"   Password: {'*' * len(entry.password) if entry.password else 'N/A'}")
-            print(f"   URL: {entry.url or 'N/A'}")
-            print(f"   Notes: {entry.notes[:100] + '...' if entry.notes and len(entry.notes) > 100 else entry.notes or 'N/A'}")
-            print(f"   Has Autotype: {'Yes' if entry.autotype_sequence else 'No'}")
-            if entry.autotype_sequence:
-                print(f"   Autotype Sequence: {entry.autotype_sequence}")
+        entry = kp.get_credentials(entry_title, return_entry=True)
+        lines = [
+            "\n📋 Entry Details:",
+            f"   Title: {entry.title}",
+            f"   Username: {entry.username or 'N/A'}",
+            f"   Password: {_mask(entry.password)}",
+            f"   URL: {entry.url or 'N/A'}",
+            f"   Notes: {_trunc(entry.notes)}",
+            f"   Has Autotype: {'Yes' if entry.autotype_sequence else 'No'}",
+        ]
+        if entry.autotype_sequence:
+            lines.append(f"   Autotype Sequence: {entry.autotype_sequence}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     except ValueError as e:
         print(f"❌ Entry not found: {e}")
@@ -79,84 +199,117 @@ def interactive_mode(with_gui=False):
         return
 
     try:
+        KeePassFunctions = _import_kpf()
         with KeePassFunctions(db_path, with_gui=with_gui) as kp:
-            while True:
-                print("\n" + "="*50)
-                print("Available actions:")
-                print("1. Search entries")
-                print("2. Get credentials")
-                print("3. Get full entry details")
-                print("4. Execute autotype sequence")
-                print("5. Compare GUI vs console")
-                print("6. Exit")
-                choice = input("\nEnter your choice (1-6): ").strip()
-
-                # Search entry demo
-                if choice == '1':
-                    search_term = input("Enter search term: ").strip()
-                    if search_term:
-                        entries = kp.entry_exists(search_term)
-                        if entries:
-                            print(f"\n'{search_term}' was found as title for > {entries} < entries.")
-                        else:
-                            print(f"No entries found containing '{search_term}'.")
-
-                # Get username and password demo
-                elif choice == '2':
-                    entry_title = input("Enter entry title: ").strip()
-                    if entry_title:
-                        try:
-                            username, password = kp.get_credentials(entry_title)
-                            print(f"Username: {username}")
-                            print(f"Password: {'*' * len(password) if password else 'N/A'}")
-                        except ValueError as e:
-                            print(f"Error: {e}")
-
-                # Get entry demo
-                elif choice == '3':
-                    entry_title = input("Enter entry title: ").strip()
-                    if entry_title:
-                        try:
-                            entry = kp.get_credentials(entry_title, return_entry=True)
-                            print(f"\nEntry Details:")
-                            print(f"Title: {entry.title}")
-                            print(f"Username: {entry.username}")
-                            print(f"Password: {'*' * len(entry.password) if entry.password else 'N/A'}")
-                            print(f"URL: {entry.url or 'N/A'}")
-                            print(f"Notes: {entry.notes or 'N/A'}")
-                            print(f"Autotype Sequence: {entry.autotype_sequence or 'N/A'}")
-                        except ValueError as e:
-                            print(f"Error: {e}")
-
-                # Test autotype demo
-                elif choice == '4':
-                    entry_title = input("Enter entry title for autotype: ").strip()
-                    if entry_title:
-                        print("Make sure the target window is active!")
-                        input("Press Enter when ready...")
-                        try:
-                            kp.use_KeePass_sequence(entry_title)
-                            print("Autotype sequence executed!")
-                        except ValueError as e:
-                            print(f"Error: {e}")
-                        except Exception as e:
-                            print(f"Error executing autotype: {e}")
-
-                elif choice == '5':
-                    gui_comparison_demo()
-
-                # Exit demo
-                elif choice == '6':
-                    print("Exiting interactive mode...")
-                    break
-
-                else:
-                    print("Invalid choice. Please enter 1-6.")
+            # Repeated lookups for the same key are served from cache instead of walking the entries again
+            @functools.lru_cache(maxsize=128)
+            def _cached_exists(term):
+                return kp.entry_exists(term)
+
+            @functools.lru_cache(maxsize=128)
+            def _cached_creds(title):
+                username, password = kp.get_credentials(title)
+                return username, bool(password)
+
+            @functools.lru_cache(maxsize=128)
+            def _cached_entry(title):
+                entry = kp.get_credentials(title, return_entry=True)
+                return _EntryDetails(entry.title, entry.username, bool(entry.password),
+                                     entry.url, entry.notes, entry.autotype_sequence)
+
+            try:
+                while True:
+                    sys.stdout.write(_MENU)
+                    sys.stdout.flush()
+                    choice = input("\nEnter your choice (1-6): ").strip()
+
+                    # Search entry demo
+                    if choice == '1':
+                        search_term = input("Enter search term: ").strip()
+                        if search_term:
+                            entries = _cached_exists(search_term)
+                            if entries:
+                                print(f"\n'{search_term}' was found as title for > {entries} < entries.")
+                            else:
+                                print(f"No entries found containing '{search_term}'.")
+
+                    # Get username and password demo
+                    elif choice == '2':
+                        entry_title = input("Enter entry title: ").strip()
+                        if entry_title:
+                            try:
+                                username, has_password = _cached_creds(entry_title)
+                                print(f"Username: {username}")
+                                print(f"Password: {_mask(has_password)}")
+                            except ValueError as e:
+                                print(f"Error: {e}")
+
+                    # Get entry demo
+                    elif choice == '3':
+                        entry_title = input("Enter entry title: ").strip()
+                        if entry_title:
+                            try:
+                                entry = _cached_entry(entry_title)
+                                sys.stdout.write("\n".join([
+                                    "\nEntry Details:",
+                                    f"Title: {entry.title}",
+                                    f"Username: {entry.username}",
+                                    f"Password: {_mask(entry.has_password)}",
+                                    f"URL: {entry.url or 'N/A'}",
+                                    f"Notes: {entry.notes or 'N/A'}",
+                                    f"Autotype Sequence: {entry.autotype_sequence or 'N/A'}",
+                                ]) + "\n")
+                            except ValueError as e:
+                                print(f"Error: {e}")
+
+                    # Test autotype demo
+                    elif choice == '4':
+                        entry_title = input("Enter entry title for autotype: ").strip()
+                        if entry_title:
+                            print("Make sure the target window is active!")
+                            input("Press Enter when ready...")
+                            try:
+                                kp.use_KeePass_sequence(entry_title)
+                                print("Autotype sequence executed!")
+                            except ValueError as e:
+                                print(f"Error: {e}")
+                            except Exception as e:
+                                print(f"Error executing autotype: {e}")
+
+                    elif choice == '5':
+                        gui_comparison_demo(kp, kp_db_path=db_path, kp_with_gui=with_gui)
+
+                    # Exit demo
+                    elif choice == '6':
+                        print("Exiting interactive mode...")
+                        break
+
+                    else:
+                        print("Invalid choice. Please enter 1-6.")
+            finally:
+                # Drop cached lookups before the database is closed, however the loop ends
+                _cached_exists.cache_clear()
+                _cached_creds.cache_clear()
+                _cached_entry.cache_clear()
 
     except Exception as e:
         print(f"Error in interactive mode: {e}")
 
 def main():
+    sys.stdout.write(_BANNER)
+
+    # Check if no arguments provided, show help
+    if len(sys.argv) == 1:
+        sys.stdout.write(_QUICK_HELP)
+        choice = input("Would you like to start in interactive mode? (y/N): ").strip().lower()
+        if choice in ('y', 'yes'):
+            gui_choice = input("Use GUI for password input? (y/N): ").strip().lower()
+            use_gui = gui_choice in ('y', 'yes')
+            interactive_mode(with_gui=use_gui)
+        else:
+            print("Run with --help for full usage information.")
+        return
+
     parser = argparse.ArgumentParser(
         description="KeePass Functions Demo Script",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -165,14 +318,15 @@ Examples:
   %(prog)s --db ~/passwords.kdbx --entry "My Website" --get-credentials
   %(prog)s --db ~/passwords.kdbx --entry "My Website" --get-credentials --gui
   %(prog)s --db ~/passwords.kdbx --entry "My Website" --autotype
-  %(prog)s --db ~/passwords.kdbx --search "github"
+  %(prog)s --db ~/passwords.kdbx --entry "My Website" --get-full-entry
   %(prog)s --interactive
   %(prog)s --interactive --gui
+  %(prog)s --compare
         """
     )
 
     # Database and GUI options
-    parser.add_argument('--db', '--database', type=str, 
+    parser.add_argument('--db', '--database', type=_db_path_arg, 
                        help='Path to KeePass database file')
     parser.add_argument('--gui', action='store_true', 
                        help='Use GUI for password input (default: console)')
@@ -180,20 +334,21 @@ Examples:
     # Entry selection
     parser.add_argument('--entry', type=str, 
                        help='Entry title to work with')
-    parser.add_argument('--search', type=str, 
-                       help='Search term for finding entries')
 
-    # Actions
-    parser.add_argument('--get-credentials', action='store_true', 
+    # Actions, argparse rejects more than one per invocation
+    actions = parser.add_mutually_exclusive_group()
+    actions.add_argument('--get-credentials', dest='action', action='store_const', const='get_credentials', 
                        help='Get username and password for specified entry')
-    parser.add_argument('--get-full-entry', action='store_true', 
+    actions.add_argument('--get-full-entry', dest='action', action='store_const', const='get_full_entry', 
                        help='Get full entry details for specified entry')
-    parser.add_argument('--autotype', action='store_true', 
+    actions.add_argument('--autotype', dest='action', action='store_const', const='autotype', 
                        help='Execute autotype sequence for specified entry')
 
     # Modes
     parser.add_argument('--interactive', action='store_true', 
                        help='Run in interactive mode')
+    parser.add_argument('--compare', action='store_true', 
+                       help='Run GUI vs console comparison demo')
 
     # Logging
     parser.add_argument('--verbose', '-v', action='store_true', 
@@ -204,6 +359,11 @@ Examples:
     # Setup logging
     setup_logging(args.verbose)
 
+    # Comparison mode
+    if args.compare:
+        gui_comparison_demo()
+        return
+
     # Interactive mode
     if args.interactive:
         interactive_mode(with_gui=args.gui)
@@ -215,47 +375,36 @@ Examples:
         print("Use --interactive for interactive mode or --help for usage information")
         sys.exit(1)
 
-    # Validate database path
+    # Validate database path up front for a short, clean error message
     db_path = args.db
-
-    # Execute based on action
-    action_count = sum([
-        args.get_credentials,
-        args.get_full_entry,
-        args.autotype,
-        args.list_entries,
-        bool(args.search)
-    ])
-
-    if action_count == 0:
+    if not db_path.is_file():
+        print(f"Database not found: {db_path}")
+        sys.exit(2)
+
+    # Resolve the requested action to its demo function
+    dispatch = {
+        'get_credentials': get_credentials_demo,
+        'get_full_entry': get_full_entry_demo,
+        'autotype': autotype_demo,
+    }
+
+    if args.action is None:
         print("Error: No action specified. Use --help for available actions.")
         sys.exit(1)
-    elif action_count > 1:
-        print("Error: Only one action can be specified at a time.")
+
+    if not args.entry:
+        print(f"Error: --entry is required for --{args.action.replace('_', '-')}")
         sys.exit(1)
 
-    # Execute the requested action
+    action, target = dispatch[args.action], args.entry
+
+    # Execute the requested action, opening the database once for the whole invocation
     try:
-        if args.search:
-            search_entries_demo(db_path, args.search, with_gui=args.gui)
-
-        elif args.get_credentials:
-            if not args.entry:
-                print("Error: --entry is required for --get-credentials")
-                sys.exit(1)
-            get_credentials_demo(db_path, args.entry, with_gui=args.gui)
-
-        elif args.get_full_entry:
-            if not args.entry:
-                print("Error: --entry is required for --get-full-entry")
-                sys.exit(1)
-            get_full_entry_demo(db_path, args.entry, with_gui=args.gui)
-
-        elif args.autotype:
-            if not args.entry:
-                print("Error: --entry is required for --autotype")
-                sys.exit(1)
-            autotype_demo(db_path, args.entry, with_gui=args.gui)
+        KeePassFunctions = _import_kpf()
+        input_method = "GUI" if args.gui else "console"
+        print(f"Opening database (using {input_method} input)")
+        with KeePassFunctions(db_path, with_gui=args.gui) as kp:
+            action(kp, target)
 
     except KeyboardInterrupt:
         print("\n\nOperation cancelled by user.")
@@ -264,107 +413,99 @@ Examples:
         print(f"Unexpected error: {e}")
         sys.exit(1)
 
-def get_credentials_demo(db_path, entry_title, with_gui=False):
+def get_credentials_demo(kp, entry_title):
     """Demo: Get credentials for a specific entry."""
-    input_method = "GUI" if with_gui else "console"
-    print(f"Getting credentials for entry: '{entry_title}' (using {input_method} input)")
+    print(f"Getting credentials for entry: '{entry_title}'")
 
     try:
-        with KeePassFunctions(db_path, with_gui=with_gui) as kp:
-            username, password = kp.get_credentials(entry_title)
-            print(f"✓ Username: {username}")
-            print(f"✓ Password: {'*' * len(password) if password else 'N/A'}")
+        username, password = kp.get_credentials(entry_title)
+        print(f"✓ Username: {username}")
+        print(f"✓ Password: {_mask(password)}")
 
     except ValueError as e:
         print(f"❌ Entry not found: {e}")
     except Exception as e:
         print(f"❌ Error getting credentials: {e}")
 
-def autotype_demo(db_path, entry_title, with_gui=False):
+def autotype_demo(kp, entry_title):
     """Demo: Use autotype sequence for a specific entry."""
-    input_method = "GUI" if with_gui else "console"
-    print(f"Executing autotype sequence for entry: '{entry_title}' (using {input_method} input)")
+    print(f"Executing autotype sequence for entry: '{entry_title}'")
     print("⚠️  Make sure the target application window is active!")
 
     # Give user time to switch to target window
     import time
-    for i in range(5, 0, -1):
-        print(f"⏱️  Starting autotype in {i} seconds...", end='\r')
-        time.sleep(1)
+    deadline = time.monotonic() + 5
+    remaining = 5.0
+    while remaining > 0:
+        print(f"⏱️  Starting autotype in {remaining:.1f}s...", end='\r')
+        sys.stdout.flush()
+        time.sleep(min(0.1, remaining))
+        remaining = deadline - time.monotonic()
     print("\n🚀 Executing autotype sequence...")
 
     try:
-        with KeePassFunctions(db_path, with_gui=with_gui) as kp:
-            kp.use_KeePass_sequence(entry_title)
-            print("✓ Autotype sequence completed successfully!")
+        kp.use_KeePass_sequence(entry_title)
+        print("✓ Autotype sequence completed successfully!")
 
     except ValueError as e:
         print(f"❌ Error: {e}")
     except Exception as e:
         print(f"❌ Error executing autotype: {e}")
 
-def search_entries_demo(db_path, search_term, with_gui=False):
-    """Demo: Search for entries containing a specific term."""
-    input_method = "GUI" if with_gui else "console"
-    print(f"🔍 Searching for entries containing '{search_term}' (using {input_method} input):")
-
-    try:
-        with KeePassFunctions(db_path, with_gui=with_gui) as kp:
-            # Search in title, username, and URL
-            entries = kp.search_entries(title=search_term, max_results=10)
-
-            # Remove duplicates
-            unique_entries = list({entry.uuid: entry for entry in entries}.values())
-
-            if not unique_entries:
-                print(f"❌ No entries found containing '{search_term}'.")
-                return
-
-            print(f"\n✓ Found {len(unique_entries)} matching entries:")
-            print("-" * 60)
-
-            for i, entry in enumerate(unique_entries, 1):
-                print(f"{i}. 📝 {entry.title}")
-                if entry.username:
-                    print(f"   👤 Username: {entry.username}")
-                if entry.url:
-                    print(f"   🌐 URL: {entry.url}")
-                print()
+def gui_comparison_demo(kp=None, kp_db_path=None, kp_with_gui=False):
+    """Demo: Show the difference between GUI and console input.
 
-    except Exception as e:
-        print(f"❌ Error searching entries: {e}")
-
-def gui_comparison_demo():
-    """Demo: Show the difference between GUI and console input."""
+    Args:
+        kp (KeePassFunctions, optional): Already opened database, reused instead of decrypting it again
+        kp_db_path (str, optional): Path of the database kp was opened from
+        kp_with_gui (bool): Whether kp was opened with GUI input
+    """
     print("\n🔄 GUI vs Console Input Comparison Demo")
     print("="*50)
 
-    db_path = input("Enter path to KeePass database file for comparison: ").strip()
-    if not db_path:
-        print("No database path provided. Skipping comparison demo.")
-        return
+    if kp is not None:
+        # The open handle already proves one input method works, only the other one is tested
+        entries_count = _cached_entry_count(kp, kp_db_path) if kp_db_path else kp.get_entry_count()
+        print(f"   ✓ Current database is open with > {entries_count} < entries")
+        db_path = input("Enter path to another KeePass database to compare (leave empty to skip): ").strip()
+        if not db_path:
+            print("Reusing the open database, skipping comparison demo.")
+            return
+        if kp_db_path and _normalize_path(db_path) == _normalize_path(kp_db_path):
+            print("That database is already open, skipping comparison demo.")
+            return
+    else:
+        db_path = input("Enter path to KeePass database file for comparison: ").strip()
+        if not db_path:
+            print("No database path provided. Skipping comparison demo.")
+            return
+
+    import logging
+    KeePassFunctions = _import_kpf()
 
     try:
-        print("\n1️⃣  Testing with CONSOLE input:")
-        print("   You'll be prompted for password in the terminal")
-        try:
-            with KeePassFunctions(db_path, with_gui=False) as kp:
-                entries_count = kp.get_entry_count()
-                print(f"   ✓ Successfully opened database with > {entries_count} < entries")
-                logging.log(f"with KeePassFunctions(db_path, with_gui=False) as kp:\n\tentries_count = kp.get_entry_count()")
-        except Exception as e:
-            print(f"   ❌ Console input failed: {e}")
-            return
+        if kp is None or kp_with_gui:
+            print("\n1️⃣  Testing with CONSOLE input:")
+            print("   You'll be prompted for password in the terminal")
+            try:
+                with KeePassFunctions(db_path, with_gui=False) as console_kp:
+                    entries_count = _cached_entry_count(console_kp, db_path)
+                    print(f"   ✓ Successfully opened database with > {entries_count} < entries")
+                    logging.info("with KeePassFunctions(db_path, with_gui=%s) as console_kp:\n\tentries_count = _cached_entry_count(console_kp, db_path)", False)
+            except Exception as e:
+                print(f"   ❌ Console input failed: {e}")
+                return
 
-        print("\n2️⃣  Testing with GUI input:")
-        print("   You'll see a GUI dialog for password input")
-        try:
-            with KeePassFunctions(db_path, with_gui=True) as kp:
-                entries_count = kp.get_entry_count()
-                print(f"   ✓ Successfully opened database with > {entries_count} < entries")
-                logging.log(f"with KeePassFunctions(db_path, with_gui=True) as kp:\n\tentries_count = kp.get_entry_count()")
-        except Exception as e:
-            print(f"   ❌ GUI input failed: {e}")
+        if kp is None or not kp_with_gui:
+            print("\n2️⃣  Testing with GUI input:")
+            print("   You'll see a GUI dialog for password input")
+            try:
+                with KeePassFunctions(db_path, with_gui=True) as gui_kp:
+                    entries_count = _cached_entry_count(gui_kp, db_path)
+                    print(f"   ✓ Successfully opened database with > {entries_count} < entries")
+                    logging.info("with KeePassFunctions(db_path, with_gui=%s) as gui_kp:\n\tentries_count = _cached_entry_count(gui_kp, db_path)", True)
+            except Exception as e:
+                print(f"   ❌ GUI input failed: {e}")
 
         print("\n🎉 Comparison complete! Both input methods work.")
 
@@ -372,33 +513,4 @@ def gui_comparison_demo():
         print(f"❌ Comparison demo failed: {e}")
 
 if __name__ == "__main__":
-    print("🔐 KeePass Functions Demo Script")
-    print("="*40)
-
-    # Check if no arguments provided, show help
-    if len(sys.argv) == 1:
-        print("No arguments provided. Here are some quick examples:")
-        print("\nQuick start options:")
-        print("  python demo.py --interactive           # Interactive mode with console input")
-        print("  python demo.py --interactive --gui     # Interactive mode with GUI input")
-        print("  python demo.py --help                  # Show all options")
-        print("\nFor GUI vs Console comparison:")
-        print("  python demo.py --compare")
-        print()
-
-        choice = input("Would you like to start in interactive mode? (y/N): ").strip().lower()
-        if choice in ('y', 'yes'):
-            gui_choice = input("Use GUI for password input? (y/N): ").strip().lower()
-            use_gui = gui_choice in ('y', 'yes')
-            interactive_mode(with_gui=use_gui)
-        else:
-            print("Run with --help for full usage information.")
-        sys.exit(0)
-
-    # Handle special comparison mode
-    if len(sys.argv) == 2 and sys.argv[1] == '--compare':
-        gui_comparison_demo()
-        sys.exit(0)
-
-    # Normal argument parsing
     main()
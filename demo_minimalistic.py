@@ -19,6 +19,7 @@ try:
 except Exception as e:
     print(f'Error when accessing database file with context manager\n{e}')
 
+# Negative example: outside a context manager the database is never opened, so access is refused
 try:
     kp2 = KeePassFunctions(db_file, with_gui = False)
     print(f'Antal poster: {kp2.get_entry_count()}')